@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from .utils import Runner, init_test_repo
+
+
+@pytest.fixture(scope="session")
+def runner() -> Runner:
+    """Build the release binary once per session and share a single Runner."""
+    r = Runner(Path(__file__).resolve().parents[1])
+    r.ensure_built()
+    # Warm the binary once so the first real command in the session doesn't
+    # pay the cold-start page-ins for the executable and grammar tables.
+    subprocess.run(
+        [str(r.bin), "--version"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+    return r
+
+
+@pytest.fixture(scope="session")
+def base_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Initialize the base test repo once per session; tests get worktrees."""
+    return init_test_repo(tmp_path_factory.mktemp("base"))
+
+
+@pytest.fixture
+def repo(base_repo: Path, tmp_path: Path) -> Path:
+    """Per-test checkout derived from the shared base repo.
+
+    A worktree is a single fast subprocess, versus the ~6 spawns a full
+    `init_test_repo` costs; each test commits on its own branch so tests
+    stay isolated while sharing one object database.
+    """
+    wt = tmp_path / "wt"
+    # tmp_path names are unique per test, so they double as branch names.
+    subprocess.run(
+        ["git", "worktree", "add", "-q", "-b", f"wt-{tmp_path.name}", str(wt)],
+        cwd=base_repo,
+        check=True,
+    )
+    return wt
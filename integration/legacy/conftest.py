@@ -1,2 +1,26 @@
+from __future__ import annotations
+
+import pytest
+
+from ..utils import Runner
+from .test_comprehensive import TestRunner
+
+# The module drives its own flow when run as a script; keep pytest from
+# collecting it directly.
 collect_ignore = ["test_comprehensive.py"]
 
+
+@pytest.fixture(scope="session")
+def final_repo(runner: Runner, tmp_path_factory: pytest.TempPathFactory) -> TestRunner:
+    """Repo-after-3-commits state shared by the read-only view checks.
+
+    Depends on `runner` so the binary is built before the legacy harness
+    probes for it. Setup plus three commits runs once per session; the
+    view checks only read the resulting snapshots.
+    """
+    comprehensive = TestRunner(tmp_path_factory.mktemp("comprehensive"))
+    comprehensive.setup_test_repo()
+    comprehensive.create_initial_functions()
+    comprehensive.add_high_complexity_function()
+    comprehensive.add_critical_function()
+    return comprehensive
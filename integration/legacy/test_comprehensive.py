@@ -22,29 +22,48 @@ class Colors:
 
 
 class TestRunner:
-    def __init__(self):
+    def __init__(self, test_dir: Optional[Path] = None):
         # Resolve repository root (integration/legacy/ -> repo root)
         self.repo_root = Path(__file__).resolve().parents[2]
         self.hotspots_bin = self.repo_root / "target" / "release" / "hotspots"
-        self.test_dir = self.repo_root / "test-repo-comprehensive"
+        # An explicit test_dir keeps parallel pytest workers out of each
+        # other's way; the script default stays inspectable in the repo root.
+        self.test_dir = Path(test_dir) if test_dir else self.repo_root / "test-repo-comprehensive"
         self.commits: List[str] = []
+        # JSON blobs parsed once by hotspots_json, reused by later steps.
+        self._parsed: Dict[Path, dict] = {}
 
         if not self.hotspots_bin.exists():
             print(f"{Colors.RED}✗ Hotspots binary not found at {self.hotspots_bin}{Colors.NC}")
             sys.exit(1)
     
-    def run_command(self, cmd: List[str], cwd: Optional[Path] = None, 
-                   capture_output: bool = True, check: bool = True) -> subprocess.CompletedProcess:
-        """Run a command and return the result"""
+    def run_command(self, cmd: List[str], cwd: Optional[Path] = None,
+                   capture_output: bool = True, check: bool = True,
+                   quiet: bool = False) -> subprocess.CompletedProcess:
+        """Run a command and return the result.
+
+        quiet=True routes output to DEVNULL for commands whose output is
+        ignored, skipping the pipe setup capture_output pays.
+        """
         cwd = cwd or self.test_dir
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=cwd,
-                capture_output=capture_output,
-                text=True,
-                check=check
-            )
+            if quiet:
+                result = subprocess.run(
+                    cmd,
+                    cwd=cwd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    check=check
+                )
+            else:
+                result = subprocess.run(
+                    cmd,
+                    cwd=cwd,
+                    capture_output=capture_output,
+                    text=True,
+                    check=check
+                )
             return result
         except subprocess.CalledProcessError as e:
             if check:
@@ -53,10 +72,31 @@ class TestRunner:
                 raise
             return e
     
-    def git_command(self, args: List[str], check: bool = True) -> subprocess.CompletedProcess:
-        """Run a git command"""
-        return self.run_command(["git"] + args, check=check)
+    # Supplied inline on every git call so repo setup never needs
+    # `git config` subprocesses.
+    GIT_IDENTITY = ["-c", "user.name=Test User", "-c", "user.email=test@example.com"]
+
+    def git_command(self, args: List[str], check: bool = True,
+                    quiet: bool = False) -> subprocess.CompletedProcess:
+        """Run a git command with the test identity supplied inline"""
+        return self.run_command(["git", *self.GIT_IDENTITY, *args], check=check, quiet=quiet)
     
+    def _head_sha(self) -> str:
+        """Read the HEAD commit SHA straight from .git, skipping a rev-parse fork"""
+        head = (self.test_dir / ".git" / "HEAD").read_text().strip()
+        if head.startswith("ref: "):
+            ref = self.test_dir / ".git" / head[5:]
+            if ref.exists():
+                return ref.read_text().strip()
+            # Loose ref may have been packed
+            packed = self.test_dir / ".git" / "packed-refs"
+            if packed.exists():
+                for line in packed.read_text().splitlines():
+                    if line.endswith(head[5:]):
+                        return line.split(" ", 1)[0]
+            raise RuntimeError(f"Could not resolve {head} in {self.test_dir}")
+        return head
+
     def hotspots_command(self, args: List[str], output_file: Optional[Path] = None,
                          check: bool = True) -> subprocess.CompletedProcess:
         """Run hotspots command"""
@@ -79,6 +119,48 @@ class TestRunner:
         else:
             return self.run_command(cmd, check=check)
     
+    def hotspots_json(self, args: List[str], save_as: Optional[Path] = None,
+                      check: bool = False):
+        """Run a hotspots command and parse its JSON straight from stdout.
+
+        Skips the write-to-disk/read-back round trip the output_file path
+        pays; stdout is still saved to `save_as` as an inspectable artifact.
+        Returns (result, parsed-or-None).
+        """
+        result = subprocess.run(
+            [str(self.hotspots_bin), *args],
+            cwd=self.test_dir,
+            capture_output=True,
+            text=True,
+            check=check,
+        )
+        # Surface any warnings/errors without polluting JSON files
+        if result.stderr:
+            sys.stderr.write(result.stderr)
+        if save_as is not None and result.stdout:
+            save_as.write_text(result.stdout)
+        try:
+            data = json.loads(result.stdout) if result.stdout else None
+        except json.JSONDecodeError as e:
+            print(f"{Colors.YELLOW}⚠ Could not parse JSON output: {e}{Colors.NC}")
+            print(f"   Output: {result.stdout[:200]}")
+            data = None
+        if save_as is not None and data is not None:
+            self._parsed[save_as] = data
+        return result, data
+
+    def _load_json(self, path: Path) -> Optional[dict]:
+        """Reuse a blob parsed earlier in the run; hit disk only on a miss"""
+        data = self._parsed.get(path)
+        if data is None and path.exists() and path.stat().st_size > 0:
+            try:
+                data = json.loads(path.read_text())
+            except json.JSONDecodeError as e:
+                print(f"{Colors.YELLOW}⚠ Could not parse {path.name}: {e}{Colors.NC}")
+                return None
+            self._parsed[path] = data
+        return data
+
     def setup_test_repo(self):
         """Initialize test git repository"""
         print("1. Initializing test git repository...")
@@ -89,14 +171,12 @@ class TestRunner:
         self.test_dir.mkdir(parents=True)
         
         # Initialize git repo
-        self.git_command(["init"], check=True)
-        self.git_command(["config", "user.name", "Test User"], check=True)
-        self.git_command(["config", "user.email", "test@example.com"], check=True)
-        
+        self.git_command(["init"], check=True, quiet=True)
+
         # Create .gitignore
         (self.test_dir / ".gitignore").write_text(".hotspots/\n")
-        self.git_command(["add", ".gitignore"], check=True)
-        self.git_command(["commit", "-m", "Initial commit"], check=True)
+        self.git_command(["add", ".gitignore"], check=True, quiet=True)
+        self.git_command(["commit", "-m", "Initial commit"], check=True, quiet=True)
 
         # Clean up any existing snapshots
         hotspots_dir = self.test_dir / ".hotspots"
@@ -126,10 +206,10 @@ function moderateFunction(x: number) {
 }
 """)
         
-        self.git_command(["add", "src/main.ts"], check=True)
-        self.git_command(["commit", "-m", "Add initial functions"], check=True)
+        self.git_command(["add", "src/main.ts"], check=True, quiet=True)
+        self.git_command(["commit", "-m", "Add initial functions"], check=True, quiet=True)
         
-        commit_sha = self.git_command(["rev-parse", "HEAD"], check=True).stdout.strip()
+        commit_sha = self._head_sha()
         self.commits.append(commit_sha)
         print(f"   Commit 1: {commit_sha}")
         
@@ -187,10 +267,10 @@ function highComplexityFunction(x: number, y: number, z: number) {
 """
         main_ts.write_text(content)
         
-        self.git_command(["add", "src/main.ts"], check=True)
-        self.git_command(["commit", "-m", "Add high complexity function"], check=True)
+        self.git_command(["add", "src/main.ts"], check=True, quiet=True)
+        self.git_command(["commit", "-m", "Add high complexity function"], check=True, quiet=True)
         
-        commit_sha = self.git_command(["rev-parse", "HEAD"], check=True).stdout.strip()
+        commit_sha = self._head_sha()
         self.commits.append(commit_sha)
         print(f"   Commit 2: {commit_sha}")
         
@@ -211,38 +291,32 @@ function highComplexityFunction(x: number, y: number, z: number) {
         # Test delta with policy
         print("   Testing delta with policy...")
         delta_file = self.test_dir / "delta1.json"
-        result = self.hotspots_command(
+        result, delta_data = self.hotspots_json(
             ["analyze", "--mode", "delta", "--policy", "--format", "json", "src/main.ts"],
-            output_file=delta_file,
-            check=False
+            save_as=delta_file,
         )
-        
+
         # Check for policy violations
         print("   Checking for policy violations...")
-        if delta_file.exists() and delta_file.stat().st_size > 0:
-            try:
-                delta_data = json.loads(delta_file.read_text())
-                policy = delta_data.get("policy", {})
-                failed_count = len(policy.get("failed", []))
-                warnings_count = len(policy.get("warnings", []))
-                
-                if failed_count > 0 or warnings_count > 0:
-                    print(f"{Colors.GREEN}✓ Policy evaluation working{Colors.NC}")
-                    print(f"   Failed policies: {failed_count}")
-                    print(f"   Warnings: {warnings_count}")
-                    print("\n   Policy details:")
-                    policy_str = json.dumps(policy, indent=2)
-                    if len(policy_str) > 500:
-                        print(policy_str[:500] + "...")
-                    else:
-                        print(policy_str)
+        if delta_data is not None:
+            policy = delta_data.get("policy", {})
+            failed_count = len(policy.get("failed", []))
+            warnings_count = len(policy.get("warnings", []))
+
+            if failed_count > 0 or warnings_count > 0:
+                print(f"{Colors.GREEN}✓ Policy evaluation working{Colors.NC}")
+                print(f"   Failed policies: {failed_count}")
+                print(f"   Warnings: {warnings_count}")
+                print("\n   Policy details:")
+                policy_str = json.dumps(policy, indent=2)
+                if len(policy_str) > 500:
+                    print(policy_str[:500] + "...")
                 else:
-                    print(f"{Colors.YELLOW}⚠ No policy violations detected (may be expected){Colors.NC}")
-            except json.JSONDecodeError as e:
-                print(f"{Colors.YELLOW}⚠ Could not parse delta JSON: {e}{Colors.NC}")
-                print(f"   File contents: {delta_file.read_text()[:200]}")
+                    print(policy_str)
+            else:
+                print(f"{Colors.YELLOW}⚠ No policy violations detected (may be expected){Colors.NC}")
         else:
-            print(f"{Colors.YELLOW}⚠ Delta file is empty or missing{Colors.NC}")
+            print(f"{Colors.YELLOW}⚠ Delta output is empty or missing{Colors.NC}")
     
     def add_critical_function(self):
         """Add critical function (should trigger Critical Introduction policy)"""
@@ -272,20 +346,19 @@ function criticalFunction() {
 """
         main_ts.write_text(content)
         
-        self.git_command(["add", "src/main.ts"], check=True)
-        self.git_command(["commit", "-m", "Add critical function"], check=True)
+        self.git_command(["add", "src/main.ts"], check=True, quiet=True)
+        self.git_command(["commit", "-m", "Add critical function"], check=True, quiet=True)
         
-        commit_sha = self.git_command(["rev-parse", "HEAD"], check=True).stdout.strip()
+        commit_sha = self._head_sha()
         self.commits.append(commit_sha)
         print(f"   Commit 3: {commit_sha}")
         
         # Run snapshot analysis
         print("   Running snapshot analysis...")
         snapshot_file = self.test_dir / "snapshot3.json"
-        result = self.hotspots_command(
+        result, _ = self.hotspots_json(
             ["analyze", "--mode", "snapshot", "--format", "json", "--all-functions", "src/main.ts"],
-            output_file=snapshot_file,
-            check=False
+            save_as=snapshot_file,
         )
 
         if result.returncode != 0:
@@ -296,103 +369,82 @@ function criticalFunction() {
         # Test delta with policy
         print("   Testing delta with policy...")
         delta_file = self.test_dir / "delta2.json"
-        result = self.hotspots_command(
+        result, delta_data = self.hotspots_json(
             ["analyze", "--mode", "delta", "--policy", "--format", "json", "src/main.ts"],
-            output_file=delta_file,
-            check=False
+            save_as=delta_file,
         )
-        
-        if delta_file.exists() and delta_file.stat().st_size > 0:
-            try:
-                delta_data = json.loads(delta_file.read_text())
-                policy = delta_data.get("policy", {})
-                failed_count = len(policy.get("failed", []))
-                
-                if failed_count > 0:
-                    print(f"{Colors.GREEN}✓ Critical Introduction policy triggered{Colors.NC}")
-                    print("\n   Failed policies:")
-                    for failure in policy.get("failed", [])[:3]:
-                        print(f"     - {failure.get('id')}: {failure.get('message')}")
-                else:
-                    print(f"{Colors.YELLOW}⚠ Critical Introduction policy not triggered{Colors.NC}")
-            except json.JSONDecodeError as e:
-                print(f"{Colors.YELLOW}⚠ Could not parse delta JSON: {e}{Colors.NC}")
+
+        if delta_data is not None:
+            policy = delta_data.get("policy", {})
+            failed_count = len(policy.get("failed", []))
+
+            if failed_count > 0:
+                print(f"{Colors.GREEN}✓ Critical Introduction policy triggered{Colors.NC}")
+                print("\n   Failed policies:")
+                for failure in policy.get("failed", [])[:3]:
+                    print(f"     - {failure.get('id')}: {failure.get('message')}")
+            else:
+                print(f"{Colors.YELLOW}⚠ Critical Introduction policy not triggered{Colors.NC}")
         else:
-            print(f"{Colors.YELLOW}⚠ Delta file is empty or missing{Colors.NC}")
+            print(f"{Colors.YELLOW}⚠ Delta output is empty or missing{Colors.NC}")
     
     def test_aggregates(self):
         """Test aggregation views"""
         print("\n5. Testing aggregation views...")
         
-        snapshot_file = self.test_dir / "snapshot3.json"
-        delta_file = self.test_dir / "delta2.json"
-        
-        if snapshot_file.exists() and snapshot_file.stat().st_size > 0:
-            try:
-                snapshot_data = json.loads(snapshot_file.read_text())
-                aggregates = snapshot_data.get("aggregates", {})
-                file_count = len(aggregates.get("files", []))
-                dir_count = len(aggregates.get("directories", []))
-                
-                if file_count > 0:
-                    print(f"{Colors.GREEN}✓ Snapshot aggregates working{Colors.NC}")
-                    print(f"   File aggregates: {file_count}")
-                    print(f"   Directory aggregates: {dir_count}")
-                    if dir_count > 0:
-                        print("\n   Directory aggregates sample:")
-                        for dir_agg in aggregates.get("directories", [])[:3]:
-                            print(f"     {dir_agg.get('directory')}: sum_lrs={dir_agg.get('sum_lrs'):.2f}")
-                else:
-                    print(f"{Colors.RED}✗ Snapshot aggregates missing{Colors.NC}")
-            except json.JSONDecodeError as e:
-                print(f"{Colors.YELLOW}⚠ Could not parse snapshot JSON: {e}{Colors.NC}")
-        
-        if delta_file.exists() and delta_file.stat().st_size > 0:
-            try:
-                delta_data = json.loads(delta_file.read_text())
-                aggregates = delta_data.get("aggregates", {})
-                file_count = len(aggregates.get("files", []))
-                
-                if file_count > 0:
-                    print(f"{Colors.GREEN}✓ Delta aggregates working{Colors.NC}")
-                    print(f"   File aggregates: {file_count}")
-                else:
-                    print(f"{Colors.RED}✗ Delta aggregates missing{Colors.NC}")
-            except json.JSONDecodeError as e:
-                print(f"{Colors.YELLOW}⚠ Could not parse delta JSON: {e}{Colors.NC}")
+        snapshot_data = self._load_json(self.test_dir / "snapshot3.json")
+        if snapshot_data is not None:
+            aggregates = snapshot_data.get("aggregates", {})
+            file_count = len(aggregates.get("files", []))
+            dir_count = len(aggregates.get("directories", []))
+
+            if file_count > 0:
+                print(f"{Colors.GREEN}✓ Snapshot aggregates working{Colors.NC}")
+                print(f"   File aggregates: {file_count}")
+                print(f"   Directory aggregates: {dir_count}")
+                if dir_count > 0:
+                    print("\n   Directory aggregates sample:")
+                    for dir_agg in aggregates.get("directories", [])[:3]:
+                        print(f"     {dir_agg.get('directory')}: sum_lrs={dir_agg.get('sum_lrs'):.2f}")
+            else:
+                print(f"{Colors.RED}✗ Snapshot aggregates missing{Colors.NC}")
+
+        delta_data = self._load_json(self.test_dir / "delta2.json")
+        if delta_data is not None:
+            aggregates = delta_data.get("aggregates", {})
+            file_count = len(aggregates.get("files", []))
+
+            if file_count > 0:
+                print(f"{Colors.GREEN}✓ Delta aggregates working{Colors.NC}")
+                print(f"   File aggregates: {file_count}")
+            else:
+                print(f"{Colors.RED}✗ Delta aggregates missing{Colors.NC}")
     
     def test_trends(self):
         """Test trend semantics"""
         print("\n6. Testing trend semantics...")
         
         trends_file = self.test_dir / "trends.json"
-        result = self.hotspots_command(
+        result, trends_data = self.hotspots_json(
             ["trends", "--window", "10", "--top", "5", "--format", "json", "."],
-            output_file=trends_file,
-            check=False
+            save_as=trends_file,
         )
-        
-        if trends_file.exists() and trends_file.stat().st_size > 0:
-            try:
-                trends_data = json.loads(trends_file.read_text())
-                velocities_count = len(trends_data.get("velocities", []))
-                hotspots_count = len(trends_data.get("hotspots", []))
-                refactors_count = len(trends_data.get("refactors", []))
-                
-                print(f"   Risk velocities: {velocities_count}")
-                print(f"   Hotspots: {hotspots_count}")
-                print(f"   Refactors: {refactors_count}")
-                
-                if hotspots_count > 0:
-                    print(f"{Colors.GREEN}✓ Hotspot analysis working{Colors.NC}")
-                else:
-                    print(f"{Colors.YELLOW}⚠ No hotspots detected (may need more commits){Colors.NC}")
-            except json.JSONDecodeError as e:
-                print(f"{Colors.YELLOW}⚠ Could not parse trends JSON: {e}{Colors.NC}")
-                if trends_file.exists():
-                    print(f"   File contents: {trends_file.read_text()[:200]}")
+
+        if trends_data is not None:
+            velocities_count = len(trends_data.get("velocities", []))
+            hotspots_count = len(trends_data.get("hotspots", []))
+            refactors_count = len(trends_data.get("refactors", []))
+
+            print(f"   Risk velocities: {velocities_count}")
+            print(f"   Hotspots: {hotspots_count}")
+            print(f"   Refactors: {refactors_count}")
+
+            if hotspots_count > 0:
+                print(f"{Colors.GREEN}✓ Hotspot analysis working{Colors.NC}")
+            else:
+                print(f"{Colors.YELLOW}⚠ No hotspots detected (may need more commits){Colors.NC}")
         else:
-            print(f"{Colors.YELLOW}⚠ Trends analysis failed or file is empty{Colors.NC}")
+            print(f"{Colors.YELLOW}⚠ Trends analysis failed or output is empty{Colors.NC}")
     
     def test_text_output(self):
         """Test text output formats"""
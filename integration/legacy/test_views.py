@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from .test_comprehensive import TestRunner as ComprehensiveRunner
+
+
+def test_aggregates(final_repo: ComprehensiveRunner):
+    final_repo.test_aggregates()
+    snapshot = final_repo._load_json(final_repo.test_dir / "snapshot3.json")
+    assert snapshot is not None
+    assert snapshot.get("aggregates", {}).get("files")
+
+
+def test_trends(final_repo: ComprehensiveRunner):
+    final_repo.test_trends()
+    trends = final_repo._load_json(final_repo.test_dir / "trends.json")
+    assert trends is not None
+    assert {"velocities", "hotspots", "refactors"} <= trends.keys()
+
+
+def test_text_output(final_repo: ComprehensiveRunner):
+    # Smoke check: both text renderings should succeed over the final state.
+    result = final_repo.hotspots_command(
+        ["analyze", "--mode", "delta", "--policy", "--format", "text", "src/main.ts"],
+        check=False,
+    )
+    assert result.returncode in (0, 1)  # policy may fail with exit 1
+    result = final_repo.hotspots_command(
+        ["trends", "--window", "10", "--top", "5", "--format", "text", "."],
+        check=False,
+    )
+    assert result.returncode == 0
@@ -2,16 +2,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from .utils import Runner, init_test_repo, write_ts, read_json
+from .utils import Runner, write_ts, read_json
 
 
-def test_snapshot_delta_trends(tmp_path: Path):
-    repo_root = Path(__file__).resolve().parents[1]
-    r = Runner(repo_root)
-    r.ensure_built()
-
-    repo = init_test_repo(tmp_path)
-
+def test_snapshot_delta_trends(repo: Path, runner: Runner):
     # Commit 1: simple + moderate
     write_ts(
         repo,
@@ -26,7 +20,7 @@ function moderateFunction(x) { return x > 0 ? x * 2 : -x; }
 
     # Snapshot JSON (all functions view)
     snap1 = repo / "snap1.json"
-    proc = r.run(["analyze", "--mode", "snapshot", "--format", "json", "--all-functions", "src/main.ts"], repo, out=snap1)
+    proc = runner.run(["analyze", "--mode", "snapshot", "--format", "json", "--all-functions", "src/main.ts"], repo, out=snap1)
     assert proc.returncode == 0
     s1 = read_json(snap1)
     assert "functions" in s1 and isinstance(s1["functions"], list)
@@ -46,14 +40,14 @@ function highComplexityFunction(x, y, z) {
 
     # Snapshot 2
     snap2 = repo / "snap2.json"
-    proc = r.run(["analyze", "--mode", "snapshot", "--format", "json", "--all-functions", "src/main.ts"], repo, out=snap2)
+    proc = runner.run(["analyze", "--mode", "snapshot", "--format", "json", "--all-functions", "src/main.ts"], repo, out=snap2)
     assert proc.returncode == 0
     s2 = read_json(snap2)
     assert len(s2.get("functions", [])) >= 2
 
     # Delta + policy JSON
     delta = repo / "delta.json"
-    proc = r.run(["analyze", "--mode", "delta", "--policy", "--format", "json", "src/main.ts"], repo, out=delta)
+    proc = runner.run(["analyze", "--mode", "delta", "--policy", "--format", "json", "src/main.ts"], repo, out=delta)
     assert proc.returncode in (0, 1)  # policy may fail with exit 1
     d = read_json(delta)
     assert "deltas" in d and isinstance(d["deltas"], list)
@@ -61,7 +55,7 @@ function highComplexityFunction(x, y, z) {
 
     # Trends JSON
     trends = repo / "trends.json"
-    proc = r.run(["trends", "--window", "10", "--top", "5", "--format", "json", "."], repo, out=trends)
+    proc = runner.run(["trends", "--window", "10", "--top", "5", "--format", "json", "."], repo, out=trends)
     assert proc.returncode == 0
     t = read_json(trends)
     assert set(["velocities", "hotspots", "refactors"]).issubset(t.keys())
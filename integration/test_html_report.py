@@ -1,17 +1,13 @@
 from __future__ import annotations
 
+import mmap
+import re
 from pathlib import Path
 
-from .utils import Runner, init_test_repo, write_ts
+from .utils import Runner, write_ts
 
 
-def test_snapshot_html_report(tmp_path: Path):
-    repo_root = Path(__file__).resolve().parents[1]
-    r = Runner(repo_root)
-    r.ensure_built()
-
-    repo = init_test_repo(tmp_path)
-
+def test_snapshot_html_report(repo: Path, runner: Runner):
     # Minimal source content
     write_ts(
         repo,
@@ -22,7 +18,7 @@ function a(x){return x+1}
     )
 
     out = repo / "report.html"
-    proc = r.run(
+    proc = runner.run(
         [
             "analyze",
             "--mode",
@@ -38,6 +34,8 @@ function a(x){return x+1}
     # HTML generation writes to stderr; exit code should be 0
     assert proc.returncode == 0
     assert out.exists(), "HTML report was not generated"
-    content = out.read_text(errors="ignore").lower()
-    assert "<html" in content and "hotspots" in content
+    # Search the mapped bytes in place; decoding + lowercasing the whole
+    # report would allocate it twice.
+    with out.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        assert re.search(rb"<html", m, re.I) and re.search(rb"hotspots", m, re.I)
 
@@ -1,22 +1,67 @@
 from __future__ import annotations
 
+import functools
 import json
+import os
+import shutil
 import subprocess
 from pathlib import Path
 from typing import List, Optional
 
+try:
+    # Optional in-process bindings (cargo feature `python-bindings`). When
+    # present, CLI calls skip process spawn + tree-sitter/config startup,
+    # which is paid 3-4 times per test over subprocess.
+    from hotspots_py import run_cli
+except ImportError:
+    run_cli = None
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_built_once(repo_root: Path, bin_path: Path) -> None:
+    """Probe/build the binary at most once per process, however many Runners exist."""
+    if not bin_path.exists():
+        subprocess.run(["cargo", "build", "--release"], check=True, cwd=repo_root)
+
 
 class Runner:
     def __init__(self, repo_root: Path):
         self.repo_root = repo_root.resolve()
-        self.bin = self.repo_root / "target" / "release" / "hotspots"
+        # HOTSPOTS_BIN lets CI point at a prebuilt binary and skip the
+        # cargo probe entirely.
+        env_bin = os.environ.get("HOTSPOTS_BIN")
+        # Resolve so the path survives the per-command cwd= switches.
+        self.bin = Path(env_bin).resolve() if env_bin else self.repo_root / "target" / "release" / "hotspots"
+        self._prebuilt = env_bin is not None
+        # str(Path) is not free; resolve the argv prefix once. Keeping the
+        # spawn free of preexec_fn/pipes-to-close also lets subprocess take
+        # its cheap posix_spawn path where the platform supports it.
+        self._cmd_prefix = [str(self.bin)]
 
     def ensure_built(self) -> None:
-        if not self.bin.exists():
-            subprocess.run(["cargo", "build", "--release"], check=True, cwd=self.repo_root)
+        if self._prebuilt:
+            # Fail at setup with a clear message rather than on the first spawn.
+            if not self.bin.exists():
+                raise FileNotFoundError(f"HOTSPOTS_BIN points at a missing binary: {self.bin}")
+            return
+        _ensure_built_once(self.repo_root, self.bin)
 
     def run(self, args: List[str], cwd: Path, out: Optional[Path] = None) -> subprocess.CompletedProcess:
-        cmd = [str(self.bin)] + args
+        cmd = self._cmd_prefix + args
+        if run_cli is not None:
+            prev = os.getcwd()
+            os.chdir(cwd)
+            try:
+                code, stdout, stderr = run_cli(args)
+            finally:
+                os.chdir(prev)
+            if out is not None:
+                out.write_text(stdout)
+                stdout = ""
+            if stderr:
+                # Keep stderr out of JSON files
+                print(stderr)
+            return subprocess.CompletedProcess(cmd, code, stdout, stderr)
         if out is not None:
             with open(out, "w") as f:
                 proc = subprocess.run(
@@ -39,25 +84,45 @@ class Runner:
 
 def init_test_repo(base: Path) -> Path:
     repo = base / "e2e-repo"
-    if repo.exists():
-        subprocess.run(["rm", "-rf", str(repo)])
+    shutil.rmtree(repo, ignore_errors=True)
     repo.mkdir(parents=True, exist_ok=True)
 
-    subprocess.run(["git", "init"], cwd=repo, check=True)
-    subprocess.run(["git", "config", "user.name", "CI"], cwd=repo, check=True)
-    subprocess.run(["git", "config", "user.email", "ci@example.com"], cwd=repo, check=True)
     (repo / ".gitignore").write_text(".hotspots/\n")
-    subprocess.run(["git", "add", ".gitignore"], cwd=repo, check=True)
-    subprocess.run(["git", "commit", "-m", "init"], cwd=repo, check=True)
+    # One shell does the whole setup: five git spawns collapse into a single
+    # fork. Config is written persistently so commits made later by tests
+    # (and in derived worktrees) keep a valid identity.
+    subprocess.run(
+        [
+            "sh",
+            "-c",
+            "git init -q"
+            " && git config user.name CI"
+            " && git config user.email ci@example.com"
+            " && git add .gitignore"
+            " && git commit -qm init",
+        ],
+        cwd=repo,
+        check=True,
+    )
     return repo
 
 
 def write_ts(repo: Path, content: str) -> None:
     src = repo / "src"
     src.mkdir(exist_ok=True)
-    (src / "main.ts").write_text(content)
-    subprocess.run(["git", "add", "src/main.ts"], cwd=repo, check=True)
-    subprocess.run(["git", "commit", "-m", "update"], cwd=repo, check=True)
+    main_ts = src / "main.ts"
+    # If the file already exists it was committed by an earlier write_ts, so
+    # `commit -a` stages it and the update is a single fork instead of two.
+    tracked = main_ts.exists()
+    main_ts.write_text(content)
+    if tracked:
+        subprocess.run(["git", "commit", "-aqm", "update"], cwd=repo, check=True)
+    else:
+        subprocess.run(
+            ["sh", "-c", "git add src/main.ts && git commit -qm update"],
+            cwd=repo,
+            check=True,
+        )
 
 
 def read_json(path: Path) -> dict:
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Normalize absolute paths in golden JSON files to repo-relative paths.
+
+Golden files regenerated locally can leak the contributor's absolute
+project path into "file" keys. This rewrites them to the relative form the
+goldens are stored in, mirroring normalize_paths() in
+hotspots-core/tests/golden_tests.rs.
+
+Usage: python3 scripts/fix_golden_paths.py
+"""
+
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    # C-level parse/serialize; worthwhile across hundreds of golden files.
+    import orjson
+except ImportError:
+    orjson = None
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+# Precomputed once; the walk below only ever needs the prefix string.
+PROJECT_ROOT_STR = PROJECT_ROOT.as_posix() + "/"
+GOLDEN_DIR = PROJECT_ROOT / "tests" / "golden"
+
+
+def normalize_path_to_relative(path_str: str, root_str: str) -> str:
+    """Strip the project root prefix so the path works on any checkout.
+
+    Plain string slicing: this runs once per "file" key in every golden, and
+    Path construction plus the ValueError raised by relative_to() on misses
+    cost far more than a startswith check.
+    """
+    s = path_str.replace("\\", "/")
+    if s.startswith(root_str):
+        return s[len(root_str):]
+    return path_str
+
+
+def normalize_paths_in_json(root, root_str: str) -> None:
+    """Rewrite every "file" key in a parsed golden document, in place.
+
+    Iterative worklist rather than recursion: no frame per node and no
+    recursion limit on deeply nested documents.
+    """
+    stack = deque([root])
+    while stack:
+        data = stack.pop()
+        if isinstance(data, dict):
+            if isinstance(data.get("file"), str):
+                data["file"] = normalize_path_to_relative(data["file"], root_str)
+            stack.extend(data.values())
+        elif isinstance(data, list):
+            stack.extend(data)
+
+
+def fix_golden_file(path: Path) -> None:
+    raw = path.read_bytes()
+    if orjson is not None:
+        data = orjson.loads(raw)
+    else:
+        data = json.loads(raw)
+    normalize_paths_in_json(data, PROJECT_ROOT_STR)
+    if orjson is not None:
+        out = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        # ensure_ascii=False keeps the fallback byte-compatible with orjson,
+        # which always writes raw UTF-8.
+        out = json.dumps(data, indent=2, ensure_ascii=False).encode()
+    # Goldens are 2-space-indented JSON with a mixed trailing-newline
+    # convention; keep each file's own style so rewrites stay minimal.
+    if raw.endswith(b"\n"):
+        out += b"\n"
+    # Only touch the file when the rewrite changed something, so re-runs are
+    # read-only and git stays quiet.
+    if out != raw:
+        path.write_bytes(out)
+
+
+def main() -> None:
+    golden_files = sorted(GOLDEN_DIR.glob("*.json"))
+    # Each file is independent (read -> walk -> write), so fan out.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(fix_golden_file, golden_files))
+    print(f"Normalized {len(golden_files)} golden files")
+
+
+if __name__ == "__main__":
+    main()